@@ -1,50 +1,319 @@
 import os
 import time
 import mpv
-import pysrt
-import tempfile
+import hashlib
+from array import array
+from bisect import bisect_right
 import threading
 import argparse
-import shutil
+import contextlib
 import difflib
+import functools
+import itertools
+import json
+import mmap
+import queue
 import re
+import shutil
+import subprocess
+import sys
 import unicodedata
+import wave
 import readchar
-import pygame
 import asyncio
 import edge_tts
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from gtts import gTTS
-from langdetect import detect
-from pynput import keyboard
+from gtts.tts import gTTSError
+from langdetect import DetectorFactory, detect
+
+try:
+    from rapidfuzz import fuzz, process as rapidfuzz_process
+except ImportError:  # optional speedup, difflib is used otherwise
+    fuzz = None
+
+# Make langdetect deterministic so cached and fresh detections agree
+DetectorFactory.seed = 0
 
 # Global flags and locks
 stop_flag = threading.Event()
-pause_flag = threading.Event()
+pause_flag = threading.Event()  # set while a movie pause is holding a TTS clip
 current_tts_thread = None
 tts_lock = threading.Lock()
-
-
+tts_player = None  # audio-only mpv instance that plays the TTS clips
+_tts_stream = None  # python:// stream registered for the on-demand Edge clip
+_tts_stream_ids = itertools.count()
+_tts_loaded = None  # clip currently loaded in tts_player
+_muted = False  # TTS mute state, tracked here rather than read back from mpv
+
+# Subtitle indices handed from the mpv time-pos observer to the speak worker
+SPEAK_QUEUE_SIZE = 4
+speak_queue = queue.Queue(maxsize=SPEAK_QUEUE_SIZE)
+
+# Upcoming cues synthesized in the background so on-demand playback rarely waits
+PREFETCH_AHEAD = 4
+PREFETCH_QUEUE_SIZE = 8
+prefetch_queue = queue.Queue(maxsize=PREFETCH_QUEUE_SIZE)
+# Current cues with no clip yet, synthesized off the (boosted) speak worker
+synth_queue = queue.Queue(maxsize=SPEAK_QUEUE_SIZE)
+
+# Parallel gTTS synthesis settings
+DEFAULT_TTS_WORKERS = 12
+GTTS_RETRIES = 4
+DEFAULT_EDGE_CONCURRENCY = 16
+
+# Engines selectable with --tts-engine; pyttsx3 and piper synthesize locally
+TTS_ENGINE_NAMES = {'google': 'Google', 'edge': 'Edge', 'pyttsx3': 'pyttsx3', 'piper': 'Piper'}
+DEFAULT_EDGE_VOICE = 'en-US-AriaNeural'
+PYTTSX3_BASE_RATE = 200  # words per minute at --speed 1.0
+# pyttsx3's sapi5/nsss drivers belong to the thread that created them, so every call runs on this one
+_pyttsx3_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyttsx3")
+# Each Piper (ONNX) run is multi-threaded already, so don't run a job per core on top of that
+DEFAULT_PIPER_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+# Persistent, content-addressed TTS cache shared across runs
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "sub_tts_dub")
+DEFAULT_CACHE_SIZE_MB = 500
+CLIP_EXTENSIONS = (".mp3", ".wav")
+VOICES_TTL = 24 * 60 * 60  # refresh the cached Edge voice list daily
+LANG_SAMPLE_CHARS = 500  # langdetect is already confident well before this
+
+# --pcm-cache: store online clips as 16-bit mono WAV so mpv skips MP3 decoding on every cue
+PCM_SAMPLE_RATE = 24000
+
+# Cues closer together than this are spoken as one TTS clip (0 disables)
+DEFAULT_COALESCE_GAP_MS = 300
+COALESCE_MAX_CHARS = 240  # longer runs are split so one clip never drifts far off its cues
+
+# Cues are triggered this early to cover audio output latency (mixer buffer,
+# Bluetooth headsets, ...); the TTS player also keeps a smaller buffer than mpv's 0.2 s default
+DEFAULT_AUDIO_LATENCY_MS = 120
+TTS_AUDIO_BUFFER = 0.05
+
+# Clips this many cues behind the one playing are dropped from the OS page cache
+EVICT_BEHIND = 5
+
+# Scheduling boost for the speak worker, which starts each cue's playback
+TIMING_RT_PRIORITY = 20  # SCHED_FIFO priority on Linux (needs CAP_SYS_NICE)
+THREAD_PRIORITY_ABOVE_NORMAL = 1  # Windows SetThreadPriority level
+
+# A time-pos jump larger than this (or any jump backwards) is treated as a seek
+SEEK_THRESHOLD_MS = 1000
+
+# One SRT cue: a timing line followed by its non-blank text lines. A text line
+# that looks like the index of the next cue ends the block early, so files
+# with a missing blank line don't swallow the next cue.
+_SRT_RE = re.compile(
+    rb'(\d+):(\d\d):(\d\d)[,.](\d{1,3})[ \t]*-->[ \t]*(\d+):(\d\d):(\d\d)[,.](\d{1,3})[^\r\n]*(?:\r?\n|\Z)'
+    rb'((?:(?!\d+[ \t]*\r?\n\d+:\d\d:\d\d)[ \t]*\S[^\r\n]*(?:\r?\n|\Z))*)'
+)
+
+# ANSI "cursor home + clear screen", used to redraw menus without spawning a shell
+_CLEAR_SCREEN = "\x1b[H\x1b[J"
+if os.name == 'nt':
+    os.system('')  # turns on ANSI escape processing in the Windows console
+
+# Subtitle file names scoring below this are not worth an exact difflib ratio
+MIN_MATCH_SCORE = 0.3
+
+# Patterns used by normalize_name
+_PREFIX_RE = re.compile(r'^\w+[-_.]')
+_NONALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+
+@functools.lru_cache(maxsize=256)
 def normalize_name(name):
     """Normalize string for better matching."""
     # Remove potential prefixes like 'cmovies-' or 'www.website.com-'
-    name = re.sub(r'^\w+[-_.]', '', name)
-    # Remove accents (diacritics)
-    nfkd_form = unicodedata.normalize('NFKD', name)
-    name = "".join([c for c in nfkd_form if not unicodedata.combining(c)])
+    name = _PREFIX_RE.sub('', name)
+    # Remove accents (diacritics); pure ASCII names have none, so skip NFKD
+    if not name.isascii():
+        name = "".join([c for c in unicodedata.normalize('NFKD', name) if not unicodedata.combining(c)])
     # Lowercase, remove non-alphanumeric, and collapse whitespace
-    name = re.sub(r'[^a-z0-9]+', ' ', name.lower()).strip()
+    name = _NONALNUM_RE.sub(' ', name.lower()).strip()
     return name
 
 
-async def list_voices():
+def score_subtitle_files(movie_base_name, srt_files):
+    """Score subtitle file names against the movie name, best match first."""
+    normalized_movie_name = normalize_name(movie_base_name)
+    normalized_srt_names = [normalize_name(os.path.splitext(f)[0]) for f in srt_files]
+
+    # Both paths score names below MIN_MATCH_SCORE as 0.0 and keep the input order, so
+    # the menu looks the same with or without rapidfuzz
+    if fuzz is not None:
+        # One C++ call scores every candidate; those under the cutoff are left out
+        scores = [0.0] * len(srt_files)
+        for _, score, index in rapidfuzz_process.extract(normalized_movie_name, normalized_srt_names,
+                                                         scorer=fuzz.ratio, limit=None,
+                                                         score_cutoff=MIN_MATCH_SCORE * 100):
+            scores[index] = score / 100.0
+        scored_srt_files = list(zip(srt_files, scores))
+    else:
+        # SequenceMatcher caches its index of seq2, so keep the movie name there
+        # and only swap the candidate in; the cheap upper bounds weed out poor
+        # matches before the quadratic ratio() runs
+        matcher = difflib.SequenceMatcher(None, "", normalized_movie_name)
+        scored_srt_files = []
+        for srt_filename, normalized_srt_name in zip(srt_files, normalized_srt_names):
+            matcher.set_seq1(normalized_srt_name)
+            if matcher.real_quick_ratio() < MIN_MATCH_SCORE or matcher.quick_ratio() < MIN_MATCH_SCORE:
+                score = 0.0  # can't reach MIN_MATCH_SCORE, keep it listed at the bottom
+            else:
+                score = matcher.ratio()
+                if score < MIN_MATCH_SCORE:
+                    score = 0.0
+            scored_srt_files.append((srt_filename, score))
+
+    # Sort by score, descending
+    scored_srt_files.sort(key=lambda x: x[1], reverse=True)
+    return scored_srt_files
+
+
+@functools.cache
+def load_voices():
+    """Edge TTS voice list, cached on disk for VOICES_TTL seconds."""
+    cache_file = os.path.join(CACHE_DIR, "voices.json")
+    try:
+        if time.time() - os.path.getmtime(cache_file) < VOICES_TTL:
+            with open(cache_file, encoding='utf-8') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    try:
+        voices = asyncio.run(edge_tts.list_voices())
+    except Exception:
+        # Offline: a stale list is better than none
+        if not os.path.exists(cache_file):
+            raise
+        with open(cache_file, encoding='utf-8') as f:
+            return json.load(f)
+
+    try:
+        _write_cache(cache_file, json.dumps(voices).encode('utf-8'))
+    except OSError:
+        pass  # caching is best effort
+    return voices
+
+
+def list_voices():
     """List all available Edge TTS voices."""
     print("🗣️ Available Edge TTS Voices:")
-    voices = await edge_tts.list_voices()
-    voices = sorted(voices, key=lambda voice: voice["ShortName"])
+    voices = sorted(load_voices(), key=lambda voice: voice["ShortName"])
     for voice in voices:
         print(f"  - {voice['ShortName']}: {voice['Gender']}, {voice['Locale']}")
 
 
+def _srt_ms(h, m, s, ms):
+    """Convert SRT timecode fields to milliseconds"""
+    return ((int(h) * 60 + int(m)) * 60 + int(s)) * 1000 + int(ms.ljust(3, b'0'))
+
+
+def load_srt(path):
+    """Parse an SRT file into parallel (starts, ends, texts), ordered by start time.
+
+    Texts are flattened to a single line; cues without text are None.
+    """
+    starts, ends, texts = array('i'), array('i'), []
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return starts, ends, texts
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Fill the columns directly; no per-cue tuple is kept around
+            for m in _SRT_RE.finditer(data):
+                starts.append(_srt_ms(*m.group(1, 2, 3, 4)))
+                ends.append(_srt_ms(*m.group(5, 6, 7, 8)))
+                texts.append(m.group(9).decode('utf-8', errors='replace')
+                             .replace('\r\n', ' ').replace('\n', ' ').strip() or None)
+
+    # Cue lookup bisects on start times; files are almost always in order already
+    if any(starts[k] > starts[k + 1] for k in range(len(starts) - 1)):
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+        starts = array('i', (starts[k] for k in order))
+        ends = array('i', (ends[k] for k in order))
+        texts = [texts[k] for k in order]
+    return starts, ends, texts
+
+
+def detect_language(srt_path, texts):
+    """Detect the subtitle language, reusing the cached answer for the same file contents"""
+    with open(srt_path, 'rb') as f:
+        key = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=8)).hexdigest()
+    cache_file = os.path.join(CACHE_DIR, "lang_by_srt.json")
+    try:
+        with open(cache_file, encoding='utf-8') as f:
+            langs = json.load(f)
+    except (OSError, ValueError):
+        langs = {}
+    if langs.get(key):
+        return langs[key]
+
+    lang = detect(" ".join(text for text in texts[:10] if text)[:LANG_SAMPLE_CHARS])
+    langs[key] = lang
+    try:
+        _write_cache(cache_file, json.dumps(langs).encode('utf-8'))
+    except OSError:
+        pass  # caching is best effort
+    return lang
+
+
+def coalesce_subtitles(starts, ends, texts, max_gap_ms=DEFAULT_COALESCE_GAP_MS, max_chars=COALESCE_MAX_CHARS):
+    """Merge runs of closely spaced cues into one utterance spoken at the run's first cue.
+
+    Returns a list parallel to `texts`: the merged text on each run's first cue,
+    None on the cues it absorbed (and on empty cues).
+    """
+    speech = list(texts)
+    if max_gap_ms <= 0:
+        return speech
+
+    i, n = 0, len(texts)
+    while i < n:
+        if not texts[i]:
+            i += 1
+            continue
+        parts = [texts[i]]
+        length = len(texts[i])
+        j = i
+        while (j + 1 < n and texts[j + 1] and starts[j + 1] - ends[j] < max_gap_ms
+               and length + 1 + len(texts[j + 1]) <= max_chars):
+            j += 1
+            parts.append(texts[j])
+            length += 1 + len(texts[j])
+            speech[j] = None
+        speech[i] = " ".join(parts)
+        i = j + 1
+    return speech
+
+
+def dedup_speech(speech):
+    """Respell lines that differ only in case or spacing like their first occurrence.
+
+    Identical texts map to one cache file, so each distinct line is synthesized once.
+    """
+    first_seen = {}
+    return [first_seen.setdefault(' '.join(text.split()).lower(), text) if text else text for text in speech]
+
+
+def find_active_subtitle(starts, ends, time_ms, hint=-1):
+    """Index of the subtitle showing at `time_ms`, or -1 between cues"""
+    # The active cue rarely changes between ticks, so try the last hit first,
+    # then the cue right after it (normal forward playback)
+    n = len(starts)
+    if 0 <= hint < n and starts[hint] <= time_ms <= ends[hint]:
+        return hint
+    i = hint + 1
+    if 0 <= i < n and starts[i] <= time_ms and (i + 1 == n or starts[i + 1] > time_ms):
+        return i if ends[i] >= time_ms else -1
+    # Otherwise (seeks) a C-level binary search over the int array; numpy's
+    # searchsorted would only add a dependency for the same O(log n) lookup
+    i = bisect_right(starts, time_ms) - 1
+    if i >= 0 and ends[i] >= time_ms:
+        return i
+    return -1
+
+
 def interactive_subtitle_selection(scored_srt_files):
     """An interactive menu to select a subtitle file."""
     selected_index = 0
@@ -53,19 +322,21 @@ def interactive_subtitle_selection(scored_srt_files):
     options = scored_srt_files + [("None of the above (play without subtitles)", 0)]
 
     while True:
-        # Clear console and print menu
-        os.system('cls' if os.name == 'nt' else 'clear')
-        print("📖 Multiple subtitle files found. Use arrow keys to select, Enter to confirm.")
+        # Clear console and print menu in a single write
+        lines = [_CLEAR_SCREEN + "📖 Multiple subtitle files found. Use arrow keys to select, Enter to confirm."]
 
         for i, (filename, score) in enumerate(options):
             if "None of the above" in filename:
-                print("-" * 30) # Separator
+                lines.append("-" * 30) # Separator
                 prefix = "> " if i == selected_index else "  "
-                print(f"{prefix}{filename}")
+                lines.append(f"{prefix}{filename}")
             else:
                 recommendation = "(best match)" if i == 0 else ""
                 prefix = "> " if i == selected_index else "  "
-                print(f"{prefix}{i+1}: {filename} (score: {score:.2f}) {recommendation}")
+                lines.append(f"{prefix}{i+1}: {filename} (score: {score:.2f}) {recommendation}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
         key = readchar.readkey()
 
@@ -83,71 +354,474 @@ def interactive_subtitle_selection(scored_srt_files):
             return "CANCEL"
 
 
-def control_loop():
-    """Keyboard controls for playback"""
-    def on_press(key):
-        global current_tts_thread
+def _on_stop(player):
+    stop_flag.set()
+    print("⏹ Stopped")
+    player.command('quit')
+
+
+def _on_quit(player):
+    stop_flag.set()
+    print("👋 Quit")
+    player.command('quit')
+
+
+def _on_mute(player):
+    global _muted
+    if tts_player is None:
+        return
+    _muted = not _muted
+    tts_player.volume = 0 if _muted else 100
+    print("🔇 TTS Muted" if _muted else "🔊 TTS Unmuted")
+
+
+# Script keys; everything else (space, arrows, ...) is left to MPV
+_KEY_HANDLERS = {'s': _on_stop, 'q': _on_quit, 'm': _on_mute}
+
+
+def bind_control_keys(player, with_tts=True):
+    """Keyboard controls for playback, dispatched by MPV's own input handling"""
+    for key, handler in _KEY_HANDLERS.items():
+        if handler is _on_mute and not with_tts:
+            continue  # leave MPV's own mute key alone when there is nothing to mute
+        def on_key(state, name=None, char=None, handler=handler):
+            if state[0] in 'dp':  # key down or press; ignore key up and auto-repeat
+                handler(player)
+
+        player.register_key_binding(key, on_key)
+
+
+def boost_thread_priority():
+    """Best-effort raise of the calling thread's scheduling priority; a no-op without the privileges"""
+    if sys.platform == 'win32':
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_ABOVE_NORMAL)
+    elif sys.platform.startswith('linux'):
+        # Both calls act on the calling thread only, so synthesis workers keep their priority
         try:
-            if key == keyboard.Key.space:  # Pause/Resume
-                return  # Let MPV handle space for pause/resume
+            # RESET_ON_FORK: threads and processes started from here fall back to normal priority
+            os.sched_setscheduler(0, os.SCHED_FIFO | os.SCHED_RESET_ON_FORK, os.sched_param(TIMING_RT_PRIORITY))
+        except OSError:
+            try:
+                os.nice(-5)
+            except OSError:
+                pass
 
-            elif key.char == "s":  # Stop
-                stop_flag.set()
-                print("⏹ Stopped")
 
-            elif key.char == "q":  # Quit
-                stop_flag.set()
-                print("👋 Quit")
-                return False
+def post_latest(q, item):
+    """Put `item` on a bounded queue, discarding the oldest entry if it is full"""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
 
-            elif key.char == "m":  # Mute TTS
-                pygame.mixer.music.set_volume(0 if pygame.mixer.music.get_volume() > 0 else 1)
-                print("🔇 TTS Muted" if pygame.mixer.music.get_volume() == 0 else "🔊 TTS Unmuted")
 
-        except AttributeError:
-            pass  # Let MPV handle arrow keys and other special keys
+def drain(q):
+    """Remove and return everything currently waiting on `q`"""
+    items = []
+    while True:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            return items
 
-    with keyboard.Listener(on_press=on_press) as listener:
-        listener.join()
 
+def play_tts_audio(source, movie_paused=False):
+    """Play a TTS clip (file path or python:// stream) on the TTS player, cutting off the previous one.
 
-def play_tts_audio(filename):
-    """Play TTS audio using pygame"""
+    While the movie is paused the clip is loaded held, for follow_movie_pause to resume.
+    """
+    global _tts_loaded
     try:
-        pygame.mixer.music.load(filename)
-        pygame.mixer.music.play()
+        if movie_paused:
+            tts_player.pause = True
+        if source == _tts_loaded:
+            # Still loaded thanks to keep-open: rewind instead of re-opening and re-probing it
+            tts_player.seek(0, 'absolute')
+        else:
+            tts_player.play(source)
+            _tts_loaded = source
+        if movie_paused:
+            pause_flag.set()
+            return
+        # keep-open pauses the player at the end of each clip
+        pause_flag.clear()
+        tts_player.pause = False
     except Exception as e:
         print(f"⚠️ Failed to play TTS audio: {e}")
 
 
-def generate_tts(subs, lang, temp_dir, pre_cache, voice_speed=1.0, tts_engine='google', voice='en-US-AriaNeural'):
-    """Generate TTS files with configurable speed"""
-    audio_files = [None] * len(subs)
+def stop_tts_audio():
+    """Cut off the clip that is playing, keeping it loaded for a cheap rewind"""
+    pause_flag.clear()
+    try:
+        tts_player.pause = True
+    except Exception as e:
+        print(f"⚠️ Failed to stop TTS audio: {e}")
+
+
+def follow_movie_pause(paused):
+    """Hold the TTS clip while the movie is paused and let it finish once it resumes"""
+    try:
+        if paused:
+            if not tts_player.pause and not tts_player.eof_reached:
+                tts_player.pause = True
+                pause_flag.set()
+        elif pause_flag.is_set():
+            pause_flag.clear()
+            tts_player.pause = False
+    except Exception as e:
+        print(f"⚠️ Failed to sync TTS pause: {e}")
+
+
+def release_clip(path):
+    """Let the OS drop a played clip's pages from memory; the file stays in the TTS cache"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+class StreamingClip:
+    """Audio bytes still arriving from a TTS stream"""
+
+    def __init__(self):
+        self._chunks = []
+        self._done = False
+        self._cond = threading.Condition()
+
+    def append(self, data):
+        with self._cond:
+            self._chunks.append(data)
+            self._cond.notify_all()
+
+    def finish(self):
+        with self._cond:
+            self._done = True
+            self._cond.notify_all()
+
+    def reader(self):
+        # Every reader replays from the first byte, so mpv can re-open the
+        # stream (e.g. seek back to 0 while probing) without losing data
+        i = 0
+        while True:
+            with self._cond:
+                while i >= len(self._chunks) and not self._done:
+                    self._cond.wait()
+                if i >= len(self._chunks):
+                    return
+                chunk = self._chunks[i]
+            i += 1
+            yield chunk
+
+    def data(self):
+        with self._cond:
+            return b"".join(self._chunks)
+
+
+def stream_edge_tts(text, voice, rate_str, filename, cached_clips):
+    """Start Edge TTS synthesis and return an mpv URL that plays it as it streams in"""
+    global _tts_stream
+    clip = StreamingClip()
+
+    async def pump():
+        async for chunk in edge_tts.Communicate(text, voice, rate=rate_str).stream():
+            if chunk["type"] == "audio":
+                clip.append(chunk["data"])
+
+    def produce():
+        try:
+            asyncio.run(pump())
+        except Exception as e:
+            print(f"\n⚠️ Failed to generate TTS on-demand: {e}")
+            return
+        finally:
+            clip.finish()
+        try:
+            _write_cache(filename, clip.data(), commit=_commit_clip)
+            cached_clips.add(os.path.basename(filename))
+        except (OSError, subprocess.SubprocessError) as e:  # ffmpeg fails under --pcm-cache
+            print(f"\n⚠️ Could not cache TTS audio: {e}")
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    # Only the newest stream can still be opened; drop the previous registration
+    if _tts_stream is not None:
+        try:
+            _tts_stream.unregister()
+        except RuntimeError:
+            pass
+
+    name = f"tts{next(_tts_stream_ids)}"
+
+    @tts_player.python_stream(name)
+    def reader():
+        return clip.reader()
+
+    _tts_stream = reader
+    return f"python://{name}"
+
+
+def cache_key(text, lang, voice, speed, engine):
+    """Content-address a TTS clip by its text and synthesis parameters"""
+    return hashlib.blake2b(f"{engine}|{voice or lang}|{speed}|{text}".encode(), digest_size=16).hexdigest()
+
+
+def tts_cache_path(text, lang, voice_speed=1.0, tts_engine='google', voice=None, cache_dir=CACHE_DIR, pcm=False):
+    """Return where the clip for `text` lives in the persistent TTS cache"""
+    if tts_engine == 'google':
+        # gTTS only knows normal/slow, so don't split the cache on the exact speed
+        voice, speed = None, int(voice_speed < 1.0)
+    else:
+        speed = voice_speed
+    key = cache_key(text, lang, voice, speed, tts_engine)
+    ext = ".mp3" if tts_engine in ('google', 'edge') and not pcm else ".wav"
+    # Bucket by the first two hex digits so no directory grows past a few hundred clips
+    return os.path.join(cache_dir, key[:2], key + ext)
+
+
+def _iter_cache_clips(cache_dir=CACHE_DIR):
+    """Yield a DirEntry for every finished clip in the hash buckets.
+
+    Top-level files (voices.json, lang_by_srt.json) and in-progress .part files are skipped.
+    """
+    try:
+        with os.scandir(cache_dir) as it:
+            buckets = [entry.path for entry in it if len(entry.name) == 2 and entry.is_dir()]
+    except FileNotFoundError:
+        return
+    for bucket in buckets:
+        with os.scandir(bucket) as it:
+            yield from (e for e in it if e.name.endswith(CLIP_EXTENSIONS) and e.is_file())
+
+
+def list_cache(cache_dir=CACHE_DIR):
+    """Names of the files in the cache, read once instead of a stat per clip"""
+    # Clip names are unique digests, so bare names identify them across buckets
+    return {entry.name for entry in _iter_cache_clips(cache_dir)}
+
+
+def _partial_path(filename):
+    """Per-thread scratch name so an interrupted write never lands in the cache"""
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    return f"{filename}.{os.getpid()}-{threading.get_ident()}.part"
+
+
+def _discard(path):
+    """Remove a scratch file if it is still there"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+@contextlib.contextmanager
+def _scratch_file(filename):
+    """Yield the .part path for `filename`, deleting it again if the write or commit fails"""
+    partial = _partial_path(filename)
+    try:
+        yield partial
+    except BaseException:
+        _discard(partial)
+        raise
+
+
+def _synth_gtts(text, lang, filename, slow, retries=GTTS_RETRIES):
+    """Synthesize one subtitle with gTTS, backing off when Google rate-limits us"""
+    delay = 1.0
+    with _scratch_file(filename) as partial:
+        for attempt in range(retries + 1):
+            try:
+                gTTS(text=text, lang=lang, slow=slow).save(partial)
+                _commit_clip(partial, filename)
+                return
+            except gTTSError as e:
+                rsp = getattr(e, 'rsp', None)
+                if rsp is None or rsp.status_code != 429 or attempt == retries:
+                    raise
+                if stop_flag.wait(delay):
+                    raise  # stopping; don't keep the interpreter waiting on the backoff
+                delay *= 2
+
+
+@functools.cache
+def _pyttsx3_engine():
+    """The process-wide pyttsx3 engine; only call this on _pyttsx3_thread"""
+    import pyttsx3
+    return pyttsx3.init()
+
+
+def _pyttsx3_voice_for(engine, lang):
+    """Id of the first installed pyttsx3 voice that speaks `lang`, or None"""
+    for v in engine.getProperty('voices'):
+        for language in v.languages or []:
+            if isinstance(language, bytes):
+                language = language.decode('ascii', errors='ignore')
+            if language.lstrip('\x05').lower().startswith(lang.lower()):
+                return v.id
+    return None
+
+
+def _render_pyttsx3(text, lang, voice_speed, voice, partial):
+    """Body of _synth_pyttsx3, run on _pyttsx3_thread"""
+    engine = _pyttsx3_engine()
+    voice_id = voice or _pyttsx3_voice_for(engine, lang)
+    if voice_id:
+        engine.setProperty('voice', voice_id)
+    engine.setProperty('rate', int(PYTTSX3_BASE_RATE * voice_speed))
+    engine.save_to_file(text, partial)
+    engine.runAndWait()
+
+
+def _synth_pyttsx3(text, lang, voice_speed, voice, partial):
+    """Render one subtitle to a WAV file with the local pyttsx3 engine, from any thread"""
+    _pyttsx3_thread.submit(_render_pyttsx3, text, lang, voice_speed, voice, partial).result()
+
+
+@functools.cache
+def _piper_voice(model_path):
+    """Load a Piper voice model once per process"""
+    from piper import PiperVoice
+    return PiperVoice.load(model_path)
+
+
+def _synth_piper(text, model_path, voice_speed, partial):
+    """Render one subtitle to a WAV file with a local Piper voice model"""
+    piper_voice = _piper_voice(model_path)
+    with wave.open(partial, 'wb') as wav_file:
+        if hasattr(piper_voice, 'synthesize_wav'):  # piper-tts >= 1.3
+            from piper import SynthesisConfig
+            piper_voice.synthesize_wav(text, wav_file, syn_config=SynthesisConfig(length_scale=1 / voice_speed))
+        else:
+            piper_voice.synthesize(text, wav_file, length_scale=1 / voice_speed)
+
+
+def synthesize_clip(text, filename, tts_engine, lang, voice_speed=1.0, voice=None):
+    """Synthesize `text` into the cache file `filename` with a blocking (non-Edge) engine"""
+    if tts_engine == 'google':
+        _synth_gtts(text, lang, filename, voice_speed < 1.0)
+        return
+    with _scratch_file(filename) as partial:
+        if tts_engine == 'pyttsx3':
+            _synth_pyttsx3(text, lang, voice_speed, voice, partial)
+        elif tts_engine == 'piper':
+            _synth_piper(text, voice, voice_speed, partial)
+        else:
+            raise ValueError(f"Unknown TTS engine: {tts_engine}")
+        os.replace(partial, filename)
+
+
+async def _save_edge(text, voice, rate_str, filename):
+    """Synthesize one subtitle with Edge TTS into the cache"""
+    with _scratch_file(filename) as partial:
+        await edge_tts.Communicate(text, voice, rate=rate_str).save(partial)
+        await asyncio.to_thread(_commit_clip, partial, filename)
+
+
+def _commit_clip(partial, filename):
+    """Move a finished MP3 into the cache, decoding it to PCM first when the cache path is a .wav"""
+    if not filename.endswith(".wav"):
+        os.replace(partial, filename)
+        return
+    pcm_partial = _partial_path(filename) + ".pcm"  # must not look like a finished .wav clip
+    try:
+        subprocess.run(["ffmpeg", "-nostdin", "-loglevel", "error", "-y", "-i", partial,
+                        "-ac", "1", "-ar", str(PCM_SAMPLE_RATE), "-c:a", "pcm_s16le", "-f", "wav", pcm_partial],
+                       check=True, capture_output=True)
+        os.replace(pcm_partial, filename)
+    finally:
+        _discard(partial)
+        _discard(pcm_partial)
+
+
+def _write_cache(filename, data, commit=os.replace):
+    """Atomically write `data` to a cache file; `commit` moves the finished .part into place"""
+    with _scratch_file(filename) as partial:
+        with open(partial, 'wb') as f:
+            f.write(data)
+        commit(partial, filename)
+
+
+class Throttled:
+    """Writer for `\r` progress lines that reaches the terminal at most `hz` times a second"""
+
+    def __init__(self, hz=10):
+        self._min_interval = 1 / hz
+        self._last = 0.0
+
+    def write(self, line, force=False):
+        now = time.monotonic()
+        if force or now - self._last >= self._min_interval:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            self._last = now
+
+
+def generate_tts(texts, lang, pre_cache, voice_speed=1.0, tts_engine='google', voice=DEFAULT_EDGE_VOICE,
+                 tts_workers=DEFAULT_TTS_WORKERS, edge_concurrency=DEFAULT_EDGE_CONCURRENCY, pcm_cache=False,
+                 cached=None):
+    """Generate TTS files with configurable speed.
+
+    `cached` is the set from list_cache(); new clips are added to it so callers can keep using it.
+    """
+    audio_files = [None] * len(texts)
+    progress_line = Throttled()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    if cached is None:
+        cached = list_cache()
 
     if tts_engine == 'edge':
         # Edge TTS uses a different speed format (+x% or -x%)
         rate_str = f"{int((voice_speed - 1) * 100):+}%"
 
         async def generate_all_edge():
-            total = len(subs)
-            print(f"🗣️ Pre-generating Edge TTS for all subtitles with voice '{voice}'...")
+            total = len(texts)
+            print(f"🗣️ Pre-generating Edge TTS for all subtitles with voice '{voice}' "
+                  f"({edge_concurrency} concurrent requests)...")
 
-            tasks = []
-            for i, sub in enumerate(subs):
-                text = sub.text.replace("\n", " ").strip()
+            # Identical lines share one cache file, so only synthesize each once
+            jobs = {}
+            for i, text in enumerate(texts):
                 if not text:
                     continue
-                filename = os.path.join(temp_dir, f"sub_{i+1}.mp3")
-                if not os.path.exists(filename):
-                    communicate = edge_tts.Communicate(text, voice, rate=rate_str)
-                    tasks.append((communicate.save(filename), i))
-
-            for i, task_tuple in enumerate(asyncio.as_completed([t[0] for t in tasks])):
-                await task_tuple
-                original_index = tasks[i][1]
-                audio_files[original_index] = os.path.join(temp_dir, f"sub_{original_index+1}.mp3")
-                progress = int(((i + 1) / total) * 100)
-                print(f"\r🔄 Generating audio {i+1}/{total} ({progress}%) ", end="", flush=True)
+                filename = tts_cache_path(text, lang, voice_speed, tts_engine, voice, pcm=pcm_cache)
+                if os.path.basename(filename) in cached:
+                    audio_files[i] = filename
+                    continue
+                jobs.setdefault(filename, (text, []))[1].append(i)
+
+            done = total - sum(len(indices) for _, indices in jobs.values())
+            sem = asyncio.Semaphore(edge_concurrency)
+
+            async def one(filename, text, indices):
+                nonlocal done
+                async with sem:
+                    if stop_flag.is_set():
+                        return
+                    try:
+                        await _save_edge(text, voice, rate_str, filename)
+                        cached.add(os.path.basename(filename))
+                        for i in indices:
+                            audio_files[i] = filename
+                    except Exception as e:
+                        print(f"\n⚠️ Failed to generate TTS for sub {indices[0] + 1}: {e}")
+                done += len(indices)
+                progress = int((done / total) * 100)
+                progress_line.write(f"\r🔄 Generating audio {done}/{total} ({progress}%) ", force=done == total)
+
+            await asyncio.gather(*(one(filename, text, indices) for filename, (text, indices) in jobs.items()))
 
         if pre_cache:
             asyncio.run(generate_all_edge())
@@ -155,46 +829,100 @@ def generate_tts(subs, lang, temp_dir, pre_cache, voice_speed=1.0, tts_engine='g
         else:
             print("⚡ On-demand Edge TTS mode.")
 
-    elif tts_engine == 'google':
+    else:
+        engine_name = TTS_ENGINE_NAMES[tts_engine]
+        if tts_engine == 'pyttsx3':
+            tts_workers = 1  # the pyttsx3 engine renders one clip at a time anyway
         if pre_cache:
-            print("🗣️ Pre-generating Google TTS for all subtitles...")
-            total = len(subs)
-            for i, sub in enumerate(subs, 1):
-                if stop_flag.is_set():
-                    break
+            print(f"🗣️ Pre-generating {engine_name} TTS for all subtitles ({tts_workers} workers)...")
+            total = len(texts)
 
-                text = sub.text.replace("\n", " ").strip()
+            # Identical lines share one cache file, so only synthesize each once
+            jobs = {}
+            for i, text in enumerate(texts, 1):
                 if not text:
                     continue
-
-                filename = os.path.join(temp_dir, f"sub_{i}.mp3")
-                if not os.path.exists(filename):
+                filename = tts_cache_path(text, lang, voice_speed, tts_engine, voice, pcm=pcm_cache)
+                if os.path.basename(filename) in cached:
+                    audio_files[i - 1] = filename
+                    continue
+                jobs.setdefault(filename, (text, []))[1].append(i)
+
+            done = total - sum(len(indices) for _, indices in jobs.values())
+            executor = ThreadPoolExecutor(max_workers=tts_workers)
+            try:
+                futures = {executor.submit(synthesize_clip, text, filename, tts_engine, lang, voice_speed, voice):
+                           (filename, indices) for filename, (text, indices) in jobs.items()}
+                for future in as_completed(futures):
+                    filename, indices = futures[future]
                     try:
-                        tts = gTTS(text=text, lang=lang, slow=(voice_speed < 1.0))
-                        tts.save(filename)
+                        future.result()
+                        cached.add(os.path.basename(filename))
+                        for i in indices:
+                            audio_files[i - 1] = filename
                     except Exception as e:
-                        print(f"\n⚠️ Failed to generate TTS for sub {i}: {e}")
-                        continue
-                audio_files[i - 1] = filename
-                progress = int((i / total) * 100)
-                print(f"\r🔄 Generating audio {i}/{total} ({progress}%) ", end="", flush=True)
-            print("\n✅ All subtitles cached as audio files.")
+                        print(f"\n⚠️ Failed to generate TTS for sub {indices[0]}: {e}")
+                    done += len(indices)
+                    progress = int((done / total) * 100)
+                    progress_line.write(f"\r🔄 Generating audio {done}/{total} ({progress}%) ",
+                                        force=done == total)
+                    if stop_flag.is_set():
+                        break
+            except KeyboardInterrupt:
+                stop_flag.set()
+                raise
+            finally:
+                # When stopping early, drop queued requests instead of waiting for them
+                executor.shutdown(wait=not stop_flag.is_set(), cancel_futures=True)
+            if not stop_flag.is_set():
+                print("\n✅ All subtitles cached as audio files.")
         else:
-            print("⚡ On-demand Google TTS mode.")
+            print(f"⚡ On-demand {engine_name} TTS mode.")
 
     return audio_files
 
-def cleanup_temp_files(temp_dir):
-    """Clean up temporary files"""
+
+def trim_cache(max_bytes, cache_dir=CACHE_DIR):
+    """Evict least recently used clips until the cache fits in `max_bytes`"""
     try:
-        shutil.rmtree(temp_dir)
-        print("🧹 Cleaned up temporary files.")
+        entries = []
+        total = 0
+        for entry in _iter_cache_clips(cache_dir):
+            st = entry.stat()
+            entries.append((st.st_atime, st.st_size, entry.path))
+            total += st.st_size
     except Exception as e:
-        print(f"⚠️ Could not clean up temp files: {e}")
+        print(f"⚠️ Could not inspect TTS cache: {e}")
+        return
+
+    if total <= max_bytes:
+        return
 
+    removed = 0
+    emptied = set()
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+        emptied.add(os.path.dirname(path))
+    for bucket in emptied:
+        try:
+            os.rmdir(bucket)
+        except OSError:
+            pass  # still holds clips (or another run's .part files)
+    print(f"🧹 Trimmed {removed} old clips from the TTS cache.")
 
-def play_video_with_tts(video_path, srt_path, pre_cache, voice_speed=1.0, tts_engine='google', voice='en-US-AriaNeural'):
-    global current_tts_thread
+
+def play_video_with_tts(video_path, srt_path, pre_cache, voice_speed=1.0, tts_engine='google', voice=DEFAULT_EDGE_VOICE,
+                        tts_workers=DEFAULT_TTS_WORKERS, cache_size_mb=DEFAULT_CACHE_SIZE_MB,
+                        edge_concurrency=DEFAULT_EDGE_CONCURRENCY, coalesce_gap_ms=DEFAULT_COALESCE_GAP_MS,
+                        audio_latency_ms=DEFAULT_AUDIO_LATENCY_MS, pcm_cache=False):
+    global current_tts_thread, tts_player
 
 
     # Validate video file exists
@@ -220,18 +948,7 @@ def play_video_with_tts(video_path, srt_path, pre_cache, voice_speed=1.0, tts_en
             print(f"✅ Automatically selected the only subtitle file found: {srt_path}")
         else:
             movie_base_name, _ = os.path.splitext(os.path.basename(video_path))
-            normalized_movie_name = normalize_name(movie_base_name)
-
-            # Score and sort subtitles
-            scored_srt_files = []
-            for srt_filename in srt_files:
-                srt_base_name, _ = os.path.splitext(srt_filename)
-                normalized_srt_name = normalize_name(srt_base_name)
-                score = difflib.SequenceMatcher(None, normalized_movie_name, normalized_srt_name).ratio()
-                scored_srt_files.append((srt_filename, score))
-
-            # Sort by score, descending
-            scored_srt_files.sort(key=lambda x: x[1], reverse=True)
+            scored_srt_files = score_subtitle_files(movie_base_name, srt_files)
 
             chosen_file = interactive_subtitle_selection(scored_srt_files)
 
@@ -245,49 +962,62 @@ def play_video_with_tts(video_path, srt_path, pre_cache, voice_speed=1.0, tts_en
                 print(f"✅ You selected: {srt_path}")
 
     # --- Subtitle-dependent section ---
-    subs = None
+    texts = None
     if srt_path:
         if not os.path.exists(srt_path):
             print(f"❌ Subtitle file not found: {srt_path}")
             return
 
         try:
-            subs = pysrt.open(srt_path, encoding='utf-8')
-            if not subs:
+            starts, ends, texts = load_srt(srt_path)
+            if not texts:
                 print("❌ No subtitles found in file")
                 return
-            print(f"📄 Loaded {len(subs)} subtitles")
+            print(f"📄 Loaded {len(texts)} subtitles")
+            speech = coalesce_subtitles(starts, ends, texts, coalesce_gap_ms)
+            clips = sum(1 for text in speech if text)
+            if clips < sum(1 for text in texts if text):
+                print(f"🔗 Merged closely spaced subtitles into {clips} TTS clips")
+            speech = dedup_speech(speech)
+            unique = len(set(text for text in speech if text))
+            if unique < clips:
+                print(f"♻️ {clips - unique} repeated lines will reuse an existing clip")
+            # Status lines are built once here, not on every cue change; None marks empty cues
+            status_lines = [f"\r🎬 [{i}/{len(texts)}] {text[:50]}{'...' if len(text) > 50 else ''}" if text else None
+                            for i, text in enumerate(texts, 1)]
+            # Fire each cue early by the audio output latency so speech lands on time
+            triggers = array('i', (max(0, start - audio_latency_ms) for start in starts))
         except Exception as e:
             print(f"❌ Failed to load subtitles: {e}")
             return
 
         # Detect language
-        sample_text = " ".join(sub.text for sub in subs[:min(10, len(subs))])
         try:
-            lang = detect(sample_text)
+            lang = detect_language(srt_path, texts)
             print(f"🌍 Detected subtitle language: {lang}")
         except Exception as e:
             print(f"⚠️ Language detection failed, defaulting to 'en': {e}")
             lang = 'en'
 
-    # Initialize pygame for audio only if subs are loaded
-    if subs:
+    # Start an audio-only mpv for TTS only if subs are loaded
+    if texts:
         try:
-            pygame.mixer.init()
+            tts_player = mpv.MPV(vid='no', audio_display='no', idle=True, keep_open='yes',
+                                 audio_buffer=TTS_AUDIO_BUFFER)
             print("🔊 Audio system initialized")
         except Exception as e:
             print(f"❌ Failed to initialize audio: {e}")
             return
 
-    # Temp folder for generated TTS
-    temp_dir = tempfile.mkdtemp(prefix='movie_dub_')
-    print(f"📁 Using temp directory: {temp_dir}")
+    print(f"📁 Using TTS cache directory: {CACHE_DIR}")
 
     try:
         audio_files = []
-        if subs:
+        cached_clips = list_cache()  # names of clips already on disk, listed once per run
+        if texts:
             # Pre-cache (or not)
-            audio_files = generate_tts(subs, lang, temp_dir, pre_cache, voice_speed, tts_engine, voice)
+            audio_files = generate_tts(speech, lang, pre_cache, voice_speed, tts_engine, voice, tts_workers,
+                                       edge_concurrency, pcm_cache, cached_clips)
             if stop_flag.is_set():
                 return
 
@@ -305,11 +1035,10 @@ def play_video_with_tts(video_path, srt_path, pre_cache, voice_speed=1.0, tts_en
         player.play(video_path)
         player.wait_until_playing()
 
-        # Start keyboard control in separate thread
-        threading.Thread(target=control_loop, daemon=True).start()
+        bind_control_keys(player, with_tts=bool(texts))
 
-        if subs:
-            print("🔊 Speaking subtitles with Google TTS in sync with video...")
+        if texts:
+            print(f"🔊 Speaking subtitles with {TTS_ENGINE_NAMES[tts_engine]} TTS in sync with video...")
             print("📝 Subtitles should also display on screen")
         else:
             print("▶️ Playing video without dubbing.")
@@ -318,76 +1047,200 @@ def play_video_with_tts(video_path, srt_path, pre_cache, voice_speed=1.0, tts_en
         print("   space = pause/resume (MPV native)")
         print("   s = stop script")
         print("   q = quit")
-        if subs: print("   m = mute/unmute TTS")
+        if texts: print("   m = mute/unmute TTS")
         print("   ←/→ = seek (MPV native)")
         print("   +/- = volume (MPV native)")
         print("   v = toggle subtitle visibility (MPV native)")
         print("   j/J = cycle subtitle tracks (MPV native)")
         print("   u = toggle subtitle style override (MPV native)")
 
-        last_index = -1  # last spoken subtitle
-
-        while not stop_flag.is_set() and not player.eof_reached:
-            if subs:
-                try:
-                    # Get current playback position
-                    current_time = player.time_pos
-                    if current_time is None:
-                        time.sleep(0.05)
-                        continue
-
-                    current_time_ms = int(current_time * 1000)  # Convert to milliseconds
-
-                    # Find which subtitle matches current video time
-                    for i, sub in enumerate(subs):
-                        if sub.start.ordinal <= current_time_ms <= sub.end.ordinal:
-                            if i != last_index:
-                                filename = audio_files[i]
-
-                                # Generate on-demand if needed
-                                if filename is None:
-                                    text = sub.text.replace("\n", " ").strip()
-                                    if not text:
-                                        last_index = i
-                                        break
-
-                                    filename = os.path.join(temp_dir, f"sub_{i+1}.mp3")
-                                    try:
-                                        if tts_engine == 'edge':
-                                            rate_str = f"{int((voice_speed - 1) * 100):+}%"
-                                            communicate = edge_tts.Communicate(text, voice, rate=rate_str)
-                                            asyncio.run(communicate.save(filename))
-                                        else: # google
-                                            tts = gTTS(text=text, lang=lang, slow=(voice_speed < 1.0))
-                                            tts.save(filename)
-
-                                        audio_files[i] = filename
-                                    except Exception as e:
-                                        print(f"\n⚠️ Failed to generate TTS on-demand: {e}")
-                                        last_index = i
-                                        break
-
-                                # Play TTS audio
-                                with tts_lock:
-                                    pygame.mixer.music.stop()  # Stop previous TTS
-                                    play_tts_audio(filename)
-
-                                # Show current subtitle
-                                print(f"\r🎬 [{i+1}/{len(subs)}] {sub.text[:50]}{'...' if len(sub.text) > 50 else ''}",
-                                      end="", flush=True)
-
-                                last_index = i
-                            break
-
-                    time.sleep(0.05)
-
-                except Exception as e:
-                    if "property unavailable" not in str(e):
+        if texts:
+            # The TTS player has its own clock; keep it following the movie's pause and speed
+            @player.property_observer('pause')
+            def _on_pause(_name, paused):
+                if paused is not None:
+                    with tts_lock:
+                        follow_movie_pause(paused)
+
+            @player.property_observer('speed')
+            def _on_speed(_name, speed):
+                if speed:
+                    tts_player.speed = speed
+
+            last_index = -1  # last spoken subtitle
+            last_time_ms = None
+            rate_str = f"{int((voice_speed - 1) * 100):+}%"  # Edge speed format
+            in_flight = {}  # cache file -> Event set once its synthesis finishes
+            in_flight_lock = threading.Lock()
+            prefetching = set()  # cue indices queued for or being prefetched
+
+            def fetch_clip(i, filename):
+                """Synthesize cue `i` into `filename` once, even if the speaker and prefetcher both ask"""
+                name = os.path.basename(filename)
+                if name not in cached_clips:
+                    with in_flight_lock:
+                        pending = in_flight.get(filename)
+                        owner = pending is None
+                        if owner:
+                            pending = in_flight[filename] = threading.Event()
+                    if not owner:
+                        pending.wait()
+                    else:
+                        try:
+                            if tts_engine == 'edge':
+                                asyncio.run(_save_edge(speech[i], voice, rate_str, filename))
+                            else:
+                                synthesize_clip(speech[i], filename, tts_engine, lang, voice_speed, voice)
+                            cached_clips.add(name)
+                        finally:
+                            with in_flight_lock:
+                                del in_flight[filename]
+                            pending.set()
+                if name not in cached_clips:
+                    return None  # the other caller's synthesis failed
+                audio_files[i] = filename
+                return filename
+
+            def play_subtitle(i, source):
+                """Play the clip for subtitle `i`, if it is still the current one, and show it"""
+                if i != last_index:
+                    return  # synthesis outlasted the cue, or the user seeked away
+
+                # Play TTS audio
+                with tts_lock:
+                    play_tts_audio(source, player.pause)
+
+                behind = i - EVICT_BEHIND
+                if behind >= 0 and audio_files[behind] not in (None, source):
+                    release_clip(audio_files[behind])
+
+                # Show current subtitle
+                print(status_lines[i], end="", flush=True)
+
+            def speak_subtitle(i):
+                """Speak subtitle `i` and show it, handing it to the synth worker if it has no clip yet"""
+                # Cues merged into an earlier one have no clip of their own
+                if not speech[i]:
+                    print(status_lines[i], end="", flush=True)
+                elif audio_files[i] is None:
+                    post_latest(synth_queue, i)
+                else:
+                    play_subtitle(i, audio_files[i])
+
+            def synthesize_subtitle(i):
+                """Generate subtitle `i` on demand, then speak it"""
+                text = speech[i]
+                filename = tts_cache_path(text, lang, voice_speed, tts_engine, voice, pcm=pcm_cache)
+                if (tts_engine == 'edge' and os.path.basename(filename) not in cached_clips
+                        and filename not in in_flight):
+                    # Start playing from the first streamed chunk; the clip is cached once complete
+                    source = stream_edge_tts(text, voice, rate_str, filename, cached_clips)
+                else:  # cached, being prefetched, or a blocking engine
+                    try:
+                        source = fetch_clip(i, filename)
+                    except Exception as e:
+                        print(f"\n⚠️ Failed to generate TTS on-demand: {e}")
+                        return
+                    if source is None:
+                        return
+                play_subtitle(i, source)
+
+            def speak_worker():
+                """Speak cues posted by the time-pos observer, off mpv's event thread"""
+                # This thread only starts playback, so it can run ahead of synthesis work.
+                # It never synthesizes or starts threads, which would inherit the boost.
+                boost_thread_priority()
+                while True:
+                    i = speak_queue.get()
+                    if i is None or stop_flag.is_set():
+                        return
+                    if i != last_index:
+                        continue  # a newer cue became active while we were busy
+                    try:
+                        speak_subtitle(i)
+                    except Exception as e:
                         print(f"\n⚠️ Playback error: {e}")
-                    time.sleep(0.1)
-            else:
-                # If no subs, just wait
-                time.sleep(0.1)
+
+            def synth_worker():
+                """Synthesize and speak cues that had no clip yet, at normal priority"""
+                while True:
+                    i = synth_queue.get()
+                    if i is None or stop_flag.is_set():
+                        return
+                    if i != last_index:
+                        continue  # the cue passed while an earlier one was synthesized
+                    try:
+                        synthesize_subtitle(i)
+                    except Exception as e:
+                        print(f"\n⚠️ Playback error: {e}")
+
+            def prefetch_worker():
+                """Synthesize the cues posted by the time-pos observer before they come up"""
+                while True:
+                    j = prefetch_queue.get()
+                    if j is None or stop_flag.is_set():
+                        return
+                    try:
+                        if j > last_index and audio_files[j] is None:  # a seek may have passed it
+                            fetch_clip(j, tts_cache_path(speech[j], lang, voice_speed, tts_engine, voice,
+                                                         pcm=pcm_cache))
+                    except Exception as e:
+                        print(f"\n⚠️ Failed to prefetch TTS for sub {j + 1}: {e}")
+                    finally:
+                        prefetching.discard(j)
+
+            # Started here, so the workers never inherit speak_worker's boosted priority
+            threading.Thread(target=speak_worker, daemon=True).start()
+            threading.Thread(target=synth_worker, daemon=True).start()
+            threading.Thread(target=prefetch_worker, daemon=True).start()
+
+            @player.event_callback('seek')
+            def _on_seek(_event):
+                nonlocal last_index, last_time_ms
+                # Whatever was queued or playing belongs to the old position
+                last_index = -1
+                last_time_ms = None
+                drain(speak_queue)
+                drain(synth_queue)
+                prefetching.difference_update(drain(prefetch_queue))
+                with tts_lock:
+                    stop_tts_audio()
+
+            @player.property_observer('time-pos')
+            def _on_time(_name, value):
+                nonlocal last_index, last_time_ms
+                if value is None or stop_flag.is_set():
+                    return
+                current_time_ms = int(value * 1000)
+
+                # Seeks not reported as events (e.g. a stalled stream catching up) still
+                # show up as a jump backwards or far ahead: allow the current cue to speak again
+                if last_time_ms is not None:
+                    delta = current_time_ms - last_time_ms
+                    if delta < 0 or delta > SEEK_THRESHOLD_MS:
+                        last_index = -1
+                last_time_ms = current_time_ms
+
+                i = find_active_subtitle(triggers, ends, current_time_ms, last_index)
+                if i >= 0 and i != last_index:
+                    last_index = i
+                    if status_lines[i] is not None:  # nothing to say or show for empty cues
+                        post_latest(speak_queue, i)
+                    for j in range(i + 1, min(i + 1 + PREFETCH_AHEAD, len(speech))):
+                        if speech[j] and audio_files[j] is None and j not in prefetching:
+                            prefetching.add(j)
+                            try:
+                                prefetch_queue.put_nowait(j)
+                            except queue.Full:
+                                prefetching.discard(j)
+                                break
+
+        # mpv drives everything from its event thread; just wait for the end.
+        # The s/q keys quit mpv, so every exit path ends up here.
+        try:
+            player.wait_for_playback()
+        except mpv.ShutdownError:
+            pass
 
     except KeyboardInterrupt:
         print("\n⏹ Interrupted by user, exiting.")
@@ -395,14 +1248,17 @@ def play_video_with_tts(video_path, srt_path, pre_cache, voice_speed=1.0, tts_en
         print(f"\n❌ Unexpected error: {e}")
     finally:
         stop_flag.set()
+        post_latest(speak_queue, None)  # wake the speak, synth and prefetch workers so they exit
+        post_latest(synth_queue, None)
+        post_latest(prefetch_queue, None)
         try:
-            if subs:
-                pygame.mixer.quit()
+            if tts_player is not None:
+                tts_player.terminate()
             if 'player' in locals():
                 player.terminate()
         except:
             pass
-        cleanup_temp_files(temp_dir)
+        trim_cache(cache_size_mb * 1024 * 1024)
 
 
 if __name__ == "__main__":
@@ -413,17 +1269,31 @@ if __name__ == "__main__":
                         help="Pre-generate all TTS (slower startup, instant rewind)")
     parser.add_argument("--speed", type=float, default=1.0,
                         help="TTS voice speed (0.5-2.0 for Google, +/-%% for Edge)")
-    parser.add_argument("--tts-engine", choices=['google', 'edge'], default='google',
-                        help="Select the TTS engine")
-    parser.add_argument("--voice", default="en-US-AriaNeural",
-                        help="Specify the voice for Edge TTS")
+    parser.add_argument("--tts-engine", choices=list(TTS_ENGINE_NAMES), default='google',
+                        help="Select the TTS engine (pyttsx3 and piper run offline)")
+    parser.add_argument("--voice", default=None,
+                        help=f"Voice to use: an Edge TTS voice name (default {DEFAULT_EDGE_VOICE}), "
+                             "a Piper .onnx model path (required for piper), or a pyttsx3 voice id")
     parser.add_argument("--list-voices", action="store_true",
                         help="List available Edge TTS voices and exit")
+    parser.add_argument("--tts-workers", type=int, default=None,
+                        help=f"Number of parallel Google TTS / Piper jobs when pre-caching "
+                             f"(default {DEFAULT_TTS_WORKERS} for Google, {DEFAULT_PIPER_WORKERS} for Piper)")
+    parser.add_argument("--coalesce-gap-ms", type=int, default=DEFAULT_COALESCE_GAP_MS,
+                        help="Speak subtitles separated by less than this many ms as one TTS clip (0 disables)")
+    parser.add_argument("--audio-latency-ms", type=int, default=DEFAULT_AUDIO_LATENCY_MS,
+                        help="Start TTS this many ms before each subtitle to compensate for audio output latency")
+    parser.add_argument("--edge-concurrency", type=int, default=DEFAULT_EDGE_CONCURRENCY,
+                        help="Number of concurrent Edge TTS requests when pre-caching")
+    parser.add_argument("--cache-size-mb", type=int, default=DEFAULT_CACHE_SIZE_MB,
+                        help=f"Size cap for the persistent TTS cache in {CACHE_DIR}")
+    parser.add_argument("--pcm-cache", action="store_true",
+                        help="Cache Google/Edge clips as PCM WAV (needs ffmpeg; ~10x larger, no decoding at cue time)")
 
     args = parser.parse_args()
 
     if args.list_voices:
-        asyncio.run(list_voices())
+        list_voices()
         exit(0)
 
     if not args.movie:
@@ -433,4 +1303,37 @@ if __name__ == "__main__":
         print("⚠️ Google TTS speed must be between 0.5 and 2.0")
         exit(1)
 
-    play_video_with_tts(args.movie, args.subs, args.precache, args.speed, args.tts_engine, args.voice)
+    if args.tts_engine in ('pyttsx3', 'piper') and args.speed <= 0:
+        parser.error(f"--speed must be positive for {TTS_ENGINE_NAMES[args.tts_engine]}")
+
+    if args.tts_workers is None:
+        args.tts_workers = DEFAULT_PIPER_WORKERS if args.tts_engine == 'piper' else DEFAULT_TTS_WORKERS
+
+    if args.tts_workers < 1 or args.edge_concurrency < 1:
+        print("⚠️ --tts-workers and --edge-concurrency must be at least 1")
+        exit(1)
+
+    if args.tts_engine == 'edge' and args.voice is None:
+        args.voice = DEFAULT_EDGE_VOICE
+
+    if args.pcm_cache and shutil.which("ffmpeg") is None:
+        print("⚠️ --pcm-cache needs ffmpeg on PATH")
+        exit(1)
+
+    if args.tts_engine == 'piper' and not (args.voice and os.path.isfile(args.voice)):
+        print("⚠️ Piper needs a voice model: pass --voice path/to/voice.onnx")
+        exit(1)
+
+    if args.tts_engine == 'edge':
+        try:
+            known_voices = {voice["ShortName"] for voice in load_voices()}
+        except Exception as e:
+            print(f"⚠️ Could not fetch the Edge TTS voice list, skipping voice check: {e}")
+        else:
+            if args.voice not in known_voices:
+                print(f"⚠️ Unknown Edge TTS voice '{args.voice}'. Use --list-voices to see the available voices.")
+                exit(1)
+
+    play_video_with_tts(args.movie, args.subs, args.precache, args.speed, args.tts_engine, args.voice,
+                        args.tts_workers, args.cache_size_mb, args.edge_concurrency,
+                        args.coalesce_gap_ms, args.audio_latency_ms, args.pcm_cache)
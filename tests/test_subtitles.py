@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+from dub import coalesce_subtitles, dedup_speech, find_active_subtitle, load_srt
+
+
+def write_srt(tmp_path, content, name="subs.srt"):
+    path = tmp_path / name
+    path.write_bytes(content.encode("utf-8"))
+    return str(path)
+
+
+def test_load_srt_crlf_and_bom(tmp_path):
+    path = write_srt(tmp_path, "﻿1\r\n00:00:01,000 --> 00:00:02,500\r\nHello\r\nthere\r\n\r\n"
+                               "2\r\n00:00:03,000 --> 00:00:04,000\r\nBye\r\n")
+    starts, ends, texts = load_srt(path)
+    assert list(starts) == [1000, 3000]
+    assert list(ends) == [2500, 4000]
+    assert texts == ["Hello there", "Bye"]
+
+
+def test_load_srt_missing_blank_line(tmp_path):
+    path = write_srt(tmp_path, "1\n00:00:01,000 --> 00:00:02,000\nFirst\n"
+                               "2\n00:00:03,000 --> 00:00:04,000\nSecond\n")
+    _, _, texts = load_srt(path)
+    assert texts == ["First", "Second"]
+
+
+def test_load_srt_empty_cue_is_none(tmp_path):
+    path = write_srt(tmp_path, "1\n00:00:01,000 --> 00:00:02,000\n\n"
+                               "2\n00:00:03,000 --> 00:00:04,000\nText\n")
+    starts, _, texts = load_srt(path)
+    assert list(starts) == [1000, 3000]
+    assert texts == [None, "Text"]
+
+
+def test_load_srt_sorts_out_of_order_cues(tmp_path):
+    path = write_srt(tmp_path, "2\n00:00:05,000 --> 00:00:06,000\nLater\n\n"
+                               "1\n00:00:01,000 --> 00:00:02,5\nEarlier\n")
+    starts, ends, texts = load_srt(path)
+    assert list(starts) == [1000, 5000]
+    assert list(ends) == [2500, 6000]
+    assert texts == ["Earlier", "Later"]
+
+
+def test_load_srt_keeps_numeric_text_lines(tmp_path):
+    path = write_srt(tmp_path, "1\n00:00:01,000 --> 00:00:02,000\n42\nis the answer\n\n"
+                               "2\n00:01:00.000 --> 01:00:00.000\n2024\n")
+    starts, ends, texts = load_srt(path)
+    assert texts == ["42 is the answer", "2024"]
+    assert list(starts) == [1000, 60000]
+    assert list(ends) == [2000, 3600000]
+
+
+def test_load_srt_empty_file(tmp_path):
+    starts, ends, texts = load_srt(write_srt(tmp_path, ""))
+    assert (list(starts), list(ends), texts) == ([], [], [])
+
+
+def test_coalesce_merges_close_cues():
+    starts, ends = [0, 1100, 5000], [1000, 2000, 6000]
+    assert coalesce_subtitles(starts, ends, ["Hi.", "Hello.", "Later."], max_gap_ms=300) == \
+        ["Hi. Hello.", None, "Later."]
+
+
+def test_coalesce_respects_max_chars_and_empty_cues():
+    starts, ends = [0, 1100, 2100, 3100], [1000, 2000, 3000, 4000]
+    texts = ["aaaa", "bbbb", None, "cccc"]
+    assert coalesce_subtitles(starts, ends, texts, max_gap_ms=300, max_chars=9) == \
+        ["aaaa bbbb", None, None, "cccc"]
+    assert coalesce_subtitles(starts, ends, texts, max_gap_ms=300, max_chars=8) == texts
+
+
+def test_coalesce_disabled():
+    texts = ["a", "b"]
+    assert coalesce_subtitles([0, 100], [90, 200], texts, max_gap_ms=0) == texts
+
+
+def test_dedup_speech_folds_case_and_spacing():
+    assert dedup_speech(["Yes.", None, "yes.", " YES.  ", "No"]) == ["Yes.", None, "Yes.", "Yes.", "No"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_find_active_subtitle_matches_linear_scan(seed):
+    rng = random.Random(seed)
+    starts, ends, t = [], [], 0
+    for _ in range(50):
+        t += rng.randint(1, 500)  # no zero gaps: touching cues make the expected index ambiguous
+        starts.append(t)
+        t += rng.randint(0, 2000)
+        ends.append(t)
+
+    def brute(time_ms):
+        # Latest cue that has started; -1 once it has ended
+        i = max((k for k, start in enumerate(starts) if start <= time_ms), default=-1)
+        return i if i >= 0 and ends[i] >= time_ms else -1
+
+    hint = -1
+    for time_ms in sorted(rng.randint(-100, t + 100) for _ in range(300)):
+        expected = brute(time_ms)
+        assert find_active_subtitle(starts, ends, time_ms, hint) == expected
+        assert find_active_subtitle(starts, ends, time_ms) == expected
+        hint = expected if expected >= 0 else hint
+    # Stale hints, as after a backwards seek
+    for time_ms in (rng.randint(0, t) for _ in range(100)):
+        assert find_active_subtitle(starts, ends, time_ms, rng.randrange(len(starts))) == brute(time_ms)